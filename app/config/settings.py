@@ -7,4 +7,7 @@ class Config:
     MONGO_URI = os.getenv('MONGO_URI')
     DB_NAME = os.getenv('DB_NAME')
     DEEPSEEK_API_KEY = os.getenv('DEEPSEEK_API_KEY')
-    FLASK_ENV = os.getenv('FLASK_ENV', 'production')
\ No newline at end of file
+    FLASK_ENV = os.getenv('FLASK_ENV', 'production')
+    BATCH_MAX_QUERIES = int(os.getenv('BATCH_MAX_QUERIES', 20))
+    BATCH_MAX_LIMIT = int(os.getenv('BATCH_MAX_LIMIT', 100))  # Per sub-query; all facets share one 16MB document
+    STREAM_BATCH_SIZE = int(os.getenv('STREAM_BATCH_SIZE', 100))
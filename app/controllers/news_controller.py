@@ -1,9 +1,39 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from app.db.repositories import news_repository
 from app.utils.redis_cache import cache
+from app.utils.streaming import wants_ndjson, ndjson_response
 
 news_bp = Blueprint('news', __name__, url_prefix='/api/v1/news')
 
+
+def _stream(query):
+    """NDJSON response that encodes articles batch by batch off the Mongo cursor"""
+    batch_size = current_app.config.get('STREAM_BATCH_SIZE', 100)
+    cursor = news_repository.stream_articles(query, batch_size)
+    return ndjson_response(cursor, batch_size)
+
+
+def _build_payload(query, args, articles):
+    """Response body shared by the GET endpoints and batch results (they share cache entries)"""
+    query_type = query["type"]
+    meta = {"generated": True, "count": len(articles)}
+    if query_type == 'score':
+        meta = {"type": "score", **meta, "min_score": query["min_score"]}
+    elif query_type == 'search':
+        meta = {"type": "search", **meta, "query": query["query"]}
+    elif query_type == 'source':
+        meta = {"type": "source", **meta, "source": query["source"]}
+    elif query_type == 'nearby':
+        meta = {
+            "type": "nearby",
+            **meta,
+            "lat": args['lat'],
+            "lon": args['lon'],
+            "radius_km": query["radius_km"]
+        }
+    return {"meta": meta, "articles": articles}
+
+
 @news_bp.route('/category', methods=['GET'])
 @cache.cache_response()
 def get_by_category():
@@ -13,15 +43,13 @@ def get_by_category():
             return jsonify({"error": "Category name is required"}), 422
         
         limit = int(request.args.get('limit', 5))
+        query = {"type": "category", "category": category, "limit": limit}
+        if wants_ndjson():
+            return _stream(query)
+
         articles = news_repository.get_articles_by_category(category, limit)
         
-        return jsonify({
-            "meta": {
-                "generated": True,
-                "count": len(articles)
-            },
-            "articles": articles
-        })
+        return jsonify(_build_payload(query, request.args, articles))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -31,18 +59,13 @@ def get_by_score():
     try:
         min_score = float(request.args.get('min_score', 0.7))
         limit = int(request.args.get('limit', 5))
+        query = {"type": "score", "min_score": min_score, "limit": limit}
+        if wants_ndjson():
+            return _stream(query)
         
         articles = news_repository.get_articles_by_score(min_score, limit)
         
-        return jsonify({
-            "meta": {
-                "type": "score",
-                "generated": True,
-                "count": len(articles),
-                "min_score": min_score
-            },
-            "articles": articles
-        })
+        return jsonify(_build_payload(query, request.args, articles))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -55,17 +78,13 @@ def search_articles():
             return jsonify({"error": "Search query is required"}), 400
         
         limit = int(request.args.get('limit', 5))
+        search = {"type": "search", "query": query, "limit": limit}
+        if wants_ndjson():
+            return _stream(search)
+
         articles = news_repository.search_articles(query, limit)
         
-        return jsonify({
-            "meta": {
-                "type": "search",
-                "generated": True,
-                "count": len(articles),
-                "query": query
-            },
-            "articles": articles
-        })
+        return jsonify(_build_payload(search, request.args, articles))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -78,17 +97,13 @@ def get_by_source():
             return jsonify({"error": "Source is required"}), 400
         
         limit = int(request.args.get('limit', 5))
+        query = {"type": "source", "source": source, "limit": limit}
+        if wants_ndjson():
+            return _stream(query)
+
         articles = news_repository.get_articles_by_source(source, limit)
         
-        return jsonify({
-            "meta": {
-                "type": "source",
-                "generated": True,
-                "count": len(articles),
-                "source": source
-            },
-            "articles": articles
-        })
+        return jsonify(_build_payload(query, request.args, articles))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -104,18 +119,124 @@ def get_nearby_articles():
             return jsonify({"error": "Latitude and Longitude are required"}), 400
         
         limit = int(request.args.get('limit', 5))
+        query = {
+            "type": "nearby",
+            "lat": float(lat),
+            "lon": float(lon),
+            "radius_km": radius_km,
+            "limit": limit
+        }
+        if wants_ndjson():
+            return _stream(query)
+
         articles = news_repository.get_articles_nearby(float(lat), float(lon), radius_km, limit)
         
+        return jsonify(_build_payload(query, request.args, articles))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# Params each batch sub-query type reads; only these go into the shared cache key
+BATCH_QUERY_PARAMS = {
+    'category': ('category', 'limit'),
+    'score': ('min_score', 'limit'),
+    'search': ('q', 'limit'),
+    'source': ('source', 'limit'),
+    'nearby': ('lat', 'lon', 'radius_km', 'limit'),
+}
+
+
+def _parse_sub_query(raw, max_limit):
+    """
+    Normalise one batch sub-query into repository arguments plus the query
+    args the equivalent GET endpoint would see (used to share its cache key).
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("Each query must be an object")
+
+    query_type = raw.get('type')
+    if query_type not in BATCH_QUERY_PARAMS:
+        raise ValueError(f"Unsupported query type: {query_type}")
+
+    args = {key: str(raw[key]) for key in BATCH_QUERY_PARAMS[query_type] if key in raw}
+    limit = int(args.get('limit', 5))
+    if limit < 1 or limit > max_limit:
+        raise ValueError(f"limit must be between 1 and {max_limit}")
+    query = {"type": query_type, "limit": limit}
+
+    if query_type == 'category':
+        if not args.get('category'):
+            raise ValueError("Category name is required")
+        query["category"] = args['category']
+    elif query_type == 'score':
+        query["min_score"] = float(args.get('min_score', 0.7))
+    elif query_type == 'search':
+        if not args.get('q'):
+            raise ValueError("Search query is required")
+        query["query"] = args['q']
+    elif query_type == 'source':
+        if not args.get('source'):
+            raise ValueError("Source is required")
+        query["source"] = args['source']
+    elif query_type == 'nearby':
+        if not args.get('lat') or not args.get('lon'):
+            raise ValueError("Latitude and Longitude are required")
+        query["lat"] = float(args['lat'])
+        query["lon"] = float(args['lon'])
+        query["radius_km"] = float(args.get('radius_km', 10))
+
+    return query, args
+
+
+@news_bp.route('/batch', methods=['POST'])
+def get_batch():
+    try:
+        body = request.get_json(silent=True)
+        raw_queries = body.get('queries') if isinstance(body, dict) else None
+        if not isinstance(raw_queries, list) or not raw_queries:
+            return jsonify({"error": "A non-empty list of queries is required"}), 400
+
+        max_queries = current_app.config.get('BATCH_MAX_QUERIES', 20)
+        if len(raw_queries) > max_queries:
+            return jsonify({"error": f"At most {max_queries} queries are allowed per batch"}), 400
+
+        max_limit = current_app.config.get('BATCH_MAX_LIMIT', 100)
+        results = [None] * len(raw_queries)
+        parsed = {}
+        for index, raw in enumerate(raw_queries):
+            try:
+                parsed[index] = _parse_sub_query(raw, max_limit)
+            except ValueError as e:
+                results[index] = {"error": str(e)}
+
+        # Sub-queries share cache entries with their GET counterparts; one MGET covers them all
+        keys = {
+            index: cache.make_key(f"{news_bp.url_prefix}/{query['type']}", args)
+            for index, (query, args) in parsed.items()
+        }
+        cached = cache.get_many(list(keys.values()))
+        misses = []
+        for (index, key), payload in zip(keys.items(), cached):
+            if payload is not None:
+                results[index] = payload
+            else:
+                misses.append(index)
+
+        fresh = {}
+        if misses:
+            batches = news_repository.get_articles_batch([parsed[i][0] for i in misses])
+            for index, articles in zip(misses, batches):
+                query, args = parsed[index]
+                results[index] = _build_payload(query, args, articles)
+                fresh[keys[index]] = results[index]
+            cache.set_many(fresh)
+
         return jsonify({
             "meta": {
-                "type": "nearby",
-                "generated": True,
-                "count": len(articles),
-                "lat": lat,
-                "lon": lon,
-                "radius_km": radius_km
+                "type": "batch",
+                "count": len(results),
+                "cache_hits": len(keys) - len(misses)
             },
-            "articles": articles
+            "results": results
         })
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
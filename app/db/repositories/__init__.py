@@ -5,6 +5,8 @@ from .news_repository import (
     search_articles,
     get_articles_by_source,
     get_articles_nearby,
+    get_articles_batch,
+    stream_articles,
 )
 
 __all__ = [
@@ -13,4 +15,6 @@ __all__ = [
     'search_articles',
     'get_articles_by_source',
     'get_articles_nearby',
+    'get_articles_batch',
+    'stream_articles',
 ]
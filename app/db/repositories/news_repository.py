@@ -1,6 +1,6 @@
 from app.services.llm_service import GeminiService  # Changed from GeminiService to GeminiService
 from app.db.mongodb import get_db
-from typing import List, Dict
+from typing import List, Dict, Optional
 import json
 
 llm = GeminiService()  # Initialize GeminiService instead of GeminiService
@@ -13,28 +13,37 @@ def generate_and_store_articles(category: str, count: int = 5) -> None:
     db = get_db()
     
     if db.articles.count_documents({"category": category}) < 10:  # Only generate if DB is empty
-        articles, error = llm.generate_news_articles(category,count)
-        
-        if error:
-            print(f"LLM Error: {error}")
-            articles = llm._get_fallback_articles(count)  # Use fallback data if API fails
-        
-        # Generate summaries for each article
-        for article in articles:
-            summary, summary_error = llm.generate_summary(
-                f"{article['title']}. {article['description']}"
-            )
-            if summary_error:
-                print(f"Summary Error: {summary_error}")
-                # Fallback: Use the first 200 chars of description if summary fails
-                summary = article['description'][:200] + "..."
-            article['llm_summary'] = summary
-        
-        try:
-            db.articles.insert_many(articles)
-            print(f"Successfully inserted {len(articles)} articles.")
-        except Exception as e:
-            print(f"Database Error: Failed to insert articles. {str(e)}")
+        _insert_generated_articles(category, count)
+
+
+def _insert_generated_articles(category: str, count: int) -> None:
+    """Generates `count` articles (with summaries) for a category and inserts them."""
+    db = get_db()
+    articles, error = llm.generate_news_articles(category,count)
+    
+    if error:
+        print(f"LLM Error: {error}")
+        articles = llm._get_fallback_articles(count)  # Use fallback data if API fails
+    
+    # Generate summaries for each article
+    for article in articles:
+        summary, summary_error = llm.generate_summary(
+            f"{article['title']}. {article['description']}"
+        )
+        if summary_error:
+            print(f"Summary Error: {summary_error}")
+            # Fallback: Use the first 200 chars of description if summary fails
+            summary = article['description'][:200] + "..."
+        article['llm_summary'] = summary
+    
+    if llm.cache:
+        print(f"LLM cache stats: {llm.cache.stats()}")
+    
+    try:
+        db.articles.insert_many(articles)
+        print(f"Successfully inserted {len(articles)} articles.")
+    except Exception as e:
+        print(f"Database Error: Failed to insert articles. {str(e)}")
 
 def get_articles_by_category(category: str, limit: int = 5) -> List[Dict]:
     """
@@ -103,22 +112,26 @@ def get_articles_by_source(source: str, limit: int = 5) -> List[Dict]:
     return articles
 
 
-def get_articles_nearby(lat: float, lon: float, radius_km: float = 10, limit: int = 5) -> List[Dict]:
-    db = get_db()
+def _nearby_pipeline(lat: float, lon: float, radius_km: float, limit: int) -> List[Dict]:
     radius_meters = radius_km * 1000
-    db.articles.create_index([("location", "2dsphere")])
-    
-    pipeline = [
+    return [
         {
             "$geoNear": {
                 "near": {"type": "Point", "coordinates": [lon, lat]},
                 "distanceField": "distance_meters",
                 "maxDistance": radius_meters,
-                "spherical": True,
-                "limit": limit
+                "spherical": True
             }
-        }
+        },
+        {"$limit": limit}  # $geoNear's own "limit" option was removed in MongoDB 4.2
     ]
+
+
+def get_articles_nearby(lat: float, lon: float, radius_km: float = 10, limit: int = 5) -> List[Dict]:
+    db = get_db()
+    db.articles.create_index([("location", "2dsphere")])
+    
+    pipeline = _nearby_pipeline(lat, lon, radius_km, limit)
     
     results = list(db.articles.aggregate(pipeline))
     
@@ -131,3 +144,127 @@ def get_articles_nearby(lat: float, lon: float, radius_km: float = 10, limit: in
         article["distance_km"] = round(article.pop("distance_meters", 0) / 1000, 2)
     
     return results
+
+
+def _batch_match(query: Dict) -> Optional[Dict]:
+    """Mongo filter for sub-queries that can share a single $facet round-trip."""
+    query_type = query["type"]
+    if query_type == "category":
+        return {"category": query["category"]}
+    if query_type == "score":
+        return {"relevance_score": {"$gte": query["min_score"]}}
+    if query_type == "source":
+        return {"source_name": {"$regex": f"^{query['source']}$", "$options": "i"}}
+    return None  # $text and $geoNear must be the first stage of their own pipeline
+
+
+def _ensure_categories_seeded(limits: Dict[str, int]) -> None:
+    """
+    Batch equivalent of `generate_and_store_articles` for several categories:
+    a single grouped count instead of one count_documents call per category.
+    """
+    db = get_db()
+    counts = {
+        row["_id"]: row["count"]
+        for row in db.articles.aggregate([
+            {"$match": {"category": {"$in": list(limits)}}},
+            {"$group": {"_id": "$category", "count": {"$sum": 1}}},
+        ])
+    }
+    for category, limit in limits.items():
+        if counts.get(category, 0) < 10:
+            _insert_generated_articles(category, limit)
+
+
+def get_articles_batch(queries: List[Dict]) -> List[List[Dict]]:
+    """
+    Resolves several sub-queries with as few round-trips as possible.
+
+    Each query is a dict with a "type" (category, score, search, source or
+    nearby), a "limit" and the same typed arguments as the single-query
+    functions. Category/score/source queries are answered by one
+    aggregation with a $facet per query; search and nearby queries fall
+    back to their own functions. Results are returned in query order.
+    """
+    db = get_db()
+    results: List[Optional[List[Dict]]] = [None] * len(queries)
+
+    category_limits: Dict[str, int] = {}
+    for query in queries:
+        if query["type"] == "category":
+            category = query["category"]
+            category_limits[category] = max(category_limits.get(category, 0), query["limit"])
+    if category_limits:
+        _ensure_categories_seeded(category_limits)
+
+    matches = {}
+    facets = {}
+    for index, query in enumerate(queries):
+        match = _batch_match(query)
+        if match is not None:
+            matches[index] = match
+            facets[str(index)] = [
+                {"$match": match},
+                {"$limit": query["limit"]},
+                {"$project": {"_id": 0}},
+            ]
+
+    if facets:
+        pipeline = [
+            # Narrow the input with the union of all filters so $facet doesn't scan the collection
+            {"$match": {"$or": list(matches.values())}},
+            {"$facet": facets},
+        ]
+        grouped = next(db.articles.aggregate(pipeline), {})
+        for key, articles in grouped.items():
+            results[int(key)] = articles
+
+    for index, query in enumerate(queries):
+        query_type = query["type"]
+        articles = results[index]
+        if query_type == "search":
+            results[index] = search_articles(query["query"], query["limit"])
+        elif query_type == "nearby":
+            results[index] = get_articles_nearby(
+                query["lat"], query["lon"], query["radius_km"], query["limit"]
+            )
+        elif query_type == "score" and len(articles or []) < query["limit"]:
+            results[index] = get_articles_by_score(query["min_score"], query["limit"])
+        elif query_type == "source" and len(articles or []) < query["limit"]:
+            results[index] = get_articles_by_source(query["source"], query["limit"])
+        elif articles is None:
+            results[index] = []
+
+    return results
+
+
+def stream_articles(query: Dict, batch_size: int = 100):
+    """
+    Returns a cursor for a single query (same shape as `get_articles_batch`
+    takes) so callers can encode articles as they arrive from Mongo instead
+    of building the whole list. Unlike the list functions, short results are
+    not topped up with generated articles.
+    """
+    db = get_db()
+    query_type = query["type"]
+    limit = query["limit"]
+
+    if query_type == "category":
+        generate_and_store_articles(query["category"], limit)  # Ensure data exists
+
+    if query_type == "search":
+        db.articles.create_index([("title", "text"), ("description", "text")])
+        return db.articles.find(
+            {"$text": {"$search": query["query"]}},
+            {"_id": 0, "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(limit).batch_size(batch_size)
+
+    if query_type == "nearby":
+        db.articles.create_index([("location", "2dsphere")])
+        pipeline = _nearby_pipeline(query["lat"], query["lon"], query["radius_km"], limit) + [
+            {"$addFields": {"distance_km": {"$round": [{"$divide": ["$distance_meters", 1000]}, 2]}}},
+            {"$project": {"distance_meters": 0}},
+        ]
+        return db.articles.aggregate(pipeline, batchSize=batch_size)
+
+    return db.articles.find(_batch_match(query), {"_id": 0}).limit(limit).batch_size(batch_size)
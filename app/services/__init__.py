@@ -1,5 +1,6 @@
 # app/services/__init__.py
 from .llm_service import GeminiService
+from .llm_cache import LLMCache
 # from .news_service import (
 #     get_news_by_category,
 #     get_news_by_location,
@@ -9,6 +10,7 @@ from .llm_service import GeminiService
 
 __all__ = [
     'GeminiService',
+    'LLMCache',
     # 'get_news_by_location',
     # 'search_news',
     # 'calculate_distance'
@@ -0,0 +1,68 @@
+import json
+import re
+from typing import Any, Dict, List
+
+_decoder = json.JSONDecoder()
+_ARRAY_START = re.compile(r"\[\s*\{")
+# JSON strings (so brackets inside them are ignored) or a single bracket
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+
+
+def _match_brackets(text: str, start: int) -> int:
+    """Index just past the bracket that closes the one at `start`, or -1 if it never closes."""
+    depth = 0
+    for token in _TOKEN.finditer(text, start):
+        char = token.group()
+        if char == "[" or char == "{":
+            depth += 1
+        elif char == "]" or char == "}":
+            depth -= 1
+            if depth == 0:
+                return token.end()
+    return -1
+
+
+def extract_json_array(text: str) -> List[Dict]:
+    """
+    Find the first complete JSON array of objects embedded in free text.
+
+    The first candidate is decoded in place (the common case: one array
+    wrapped in prose). If that fails, each candidate's extent is found by
+    bracket matching before it is decoded, and the search resumes after a
+    candidate that fails, so the text is tokenised once and decode errors
+    only ever cover one candidate. A truncated or malformed array is an
+    error, not a partial result.
+    """
+    match = _ARRAY_START.search(text)
+    if match:
+        try:
+            return _decoder.raw_decode(text, match.start())[0]
+        except json.JSONDecodeError:
+            pass
+
+    pos = 0
+    while True:
+        match = _ARRAY_START.search(text, pos)
+        if not match:
+            break
+        end = _match_brackets(text, match.start())
+        if end == -1:
+            break  # Never closed: the response was cut off
+        try:
+            return json.loads(text[match.start():end])
+        except json.JSONDecodeError:
+            pos = end
+    raise ValueError("No valid JSON array found in response")
+
+
+def parse_llm_json(text: str) -> Any:
+    """
+    Try to parse JSON directly. If that fails, extract the first JSON array found in the text.
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return extract_json_array(text)
+
+
+__all__ = ["extract_json_array", "parse_llm_json"]
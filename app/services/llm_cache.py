@@ -0,0 +1,178 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class SQLiteLLMCacheBackend:
+    """On-disk store; evicts expired rows first, then the least recently used."""
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return row[0]
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now)
+            )
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                " SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+
+class RedisLLMCacheBackend:
+    """Shares the app's Redis connection; size is bounded by Redis' own maxmemory policy."""
+
+    def __init__(self, prefix: str = "llm:"):
+        from app.utils.redis_cache import cache  # Deferred: connects to Redis on import
+        self._cache = cache
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        if not self._cache._is_connected:
+            return None
+        value = self._cache._safe_cache_operation(self._cache.client.get, self.prefix + key)
+        return value.decode("utf-8") if value else None
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        if not self._cache._is_connected:
+            return
+        self._cache._safe_cache_operation(
+            self._cache.client.setex, self.prefix + key, ttl, value.encode("utf-8")
+        )
+
+    def delete(self, key: str) -> None:
+        if not self._cache._is_connected:
+            return
+        self._cache._safe_cache_operation(self._cache.client.delete, self.prefix + key)
+
+
+class LLMCache:
+    """
+    Content-addressed cache for parsed LLM results.
+
+    Entries are keyed by a digest of the model name and the full request
+    payload (prompt + generation config), so any change to either is a miss.
+    """
+
+    def __init__(self, backend, ttl: int = 7 * 24 * 3600, log_every: int = 100):
+        self.backend = backend
+        self.ttl = ttl
+        self.log_every = log_every  # Log hit-rate stats every N lookups; 0 disables
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["LLMCache"]:
+        """Build the cache configured by LLM_CACHE_* env vars; None when disabled."""
+        backend_name = os.getenv("LLM_CACHE_BACKEND", "sqlite").lower()
+        ttl = int(os.getenv("LLM_CACHE_TTL", 7 * 24 * 3600))
+        log_every = int(os.getenv("LLM_CACHE_STATS_EVERY", 100))
+        try:
+            if backend_name == "sqlite":
+                # Relative paths resolve against the project root, not the working directory
+                backend = SQLiteLLMCacheBackend(
+                    os.path.join(PROJECT_ROOT, os.getenv("LLM_CACHE_PATH", "data/llm_cache.sqlite3")),
+                    int(os.getenv("LLM_CACHE_MAX_ENTRIES", 10000))
+                )
+            elif backend_name == "redis":
+                backend = RedisLLMCacheBackend()
+            else:
+                return None
+        except Exception as e:
+            logger.error(f"LLM cache disabled, backend init failed: {str(e)}")
+            return None
+        return cls(backend, ttl, log_every)
+
+    @staticmethod
+    def make_key(model: str, payload: Dict) -> str:
+        raw = json.dumps({"model": model, "payload": payload}, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, model: str, payload: Dict) -> Optional[Any]:
+        key = self.make_key(model, payload)
+        try:
+            value = self.backend.get(key)
+            result = json.loads(value) if value is not None else None
+        except Exception as e:
+            # Unreadable or corrupt entry: count a miss and drop it so it gets refreshed
+            logger.error(f"LLM cache get failed: {str(e)}")
+            result = None
+            try:
+                self.backend.delete(key)
+            except Exception:
+                pass
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        if self.log_every and (self.hits + self.misses) % self.log_every == 0:
+            logger.info(f"LLM cache stats: {self.stats()}")
+        return result
+
+    def set(self, model: str, payload: Dict, result: Any) -> None:
+        try:
+            self.backend.set(self.make_key(model, payload), json.dumps(result), self.ttl)
+        except Exception as e:
+            logger.error(f"LLM cache set failed: {str(e)}")
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
+
+
+__all__ = ["LLMCache", "SQLiteLLMCacheBackend", "RedisLLMCacheBackend"]
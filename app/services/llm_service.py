@@ -1,14 +1,15 @@
 import os
-import re
 import requests
 import json
 from typing import List, Dict, Tuple, Optional
 from dotenv import load_dotenv
+from .llm_cache import LLMCache
+from .json_extract import parse_llm_json
 
 load_dotenv()
 
 class GeminiService:
-    def __init__(self):
+    def __init__(self, cache: Optional[LLMCache] = None):
         self.api_key = os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Missing GEMINI_API_KEY in environment variables")
@@ -16,6 +17,7 @@ class GeminiService:
         self.model = "gemini-1.5-flash"  # Fast model
         self.api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent"
         self.timeout = 30
+        self.cache = cache if cache is not None else LLMCache.from_env()
 
     def _make_api_request(self, payload: Dict) -> Tuple[Optional[Dict], Optional[str]]:
         try:
@@ -41,14 +43,7 @@ class GeminiService:
         """
         Try to parse JSON directly. If that fails, extract the first JSON array found in the text.
         """
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            # Extract JSON array from any surrounding text, handling newlines and spacing
-            match = re.search(r"\[\s*\{.*?\}\s*\]", text, re.S)
-            if match:
-                return json.loads(match.group(0))
-            raise ValueError("No valid JSON array found in response")
+        return parse_llm_json(text)
 
     def generate_news_articles(
         self,
@@ -120,6 +115,7 @@ Example output:
             articles = self._safe_json_parse(response_text)
             if not isinstance(articles, list):
                 raise ValueError("API did not return a list of articles")
+            # Not cached: backfills call this to get *new* articles to insert
             return articles, None
         except Exception as e:
             return self._get_fallback_articles(count), f"Response parsing failed: {str(e)}"
@@ -148,6 +144,11 @@ Return only the summary text, no extra formatting.
             }
         }
 
+        if self.cache:
+            cached = self.cache.get(self.model, payload)
+            if cached is not None:
+                return cached, None
+
         result, error = self._make_api_request(payload)
         if error:
             return self._truncate_fallback(text, max_length), error
@@ -156,6 +157,8 @@ Return only the summary text, no extra formatting.
             summary = result["candidates"][0]["content"]["parts"][0]["text"].strip()
             if len(summary) > max_length:
                 summary = summary[:max_length - 3] + "..."
+            if self.cache:
+                self.cache.set(self.model, payload, summary)
             return summary, None
         except Exception as e:
             return self._truncate_fallback(text, max_length), f"Summary parsing failed: {str(e)}"
@@ -2,19 +2,21 @@ import redis
 from datetime import timedelta
 from functools import wraps
 import json
-from flask import request, jsonify
+from flask import request, jsonify, Response, make_response
 import logging
 from time import sleep
 import os
 import zlib
 import base64
+from .streaming import wants_ndjson, NDJSON_MIMETYPE, STREAM_ERROR_PREFIX
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class RedisCache:
-    def __init__(self, host='localhost', port=6379, db=0, max_retries=3, compression_threshold=10240):
+    def __init__(self, host='localhost', port=6379, db=0, max_retries=3, compression_threshold=10240,
+                 stream_cache_max_bytes=1048576):
         self._is_connected = False
         self.default_ttl = int(timedelta(minutes=10).total_seconds())  # Ensure integer
         self.max_retries = max_retries
@@ -22,6 +24,7 @@ class RedisCache:
         self.port = int(os.getenv('REDIS_PORT', port))
         self.db = db
         self.compression_threshold = compression_threshold  # 10KB default
+        self.stream_cache_max_bytes = stream_cache_max_bytes  # Streamed bodies above this aren't cached
         
         # Initialize with connection retries
         self.client = self._initialize_redis()
@@ -61,10 +64,16 @@ class RedisCache:
         logger.error(f"❌ Failed to connect to Redis after {self.max_retries} attempts")
         return None
 
+    def make_key(self, path, args):
+        """Generate cache key from a route path and its query params"""
+        return f"cache:{path}:{hash(frozenset(args.items()))}"
+
     def make_cache_key(self):
         """Generate cache key from request path and query params"""
         args = dict(request.args)
-        return f"cache:{request.path}:{hash(frozenset(args.items()))}"
+        if wants_ndjson():
+            args['format'] = 'ndjson'  # Accept-negotiated NDJSON must not collide with the JSON entry
+        return self.make_key(request.path, args)
 
     def _compress_data(self, data):
         """Compress data if it exceeds threshold"""
@@ -90,13 +99,87 @@ class RedisCache:
             self._is_connected = False  # Mark as disconnected
             return None
 
+    def get_many(self, keys):
+        """Fetch several cached payloads with a single MGET.
+
+        Returns a list aligned with ``keys``; misses and undecodable
+        entries come back as None.
+        """
+        if not keys or not self._is_connected:
+            return [None] * len(keys)
+        values = self._safe_cache_operation(self.client.mget, keys)
+        if not values:
+            return [None] * len(keys)
+
+        payloads = []
+        for value in values:
+            if not value:
+                payloads.append(None)
+                continue
+            try:
+                payloads.append(json.loads(self._decompress_data(value).decode('utf-8')))
+            except Exception as e:
+                logger.error(f"Cache decompress/deserialize error: {str(e)}")
+                payloads.append(None)
+        return payloads
+
+    def set_many(self, items, ttl=None):
+        """Store several payloads (key -> JSON-serialisable dict) in one pipeline"""
+        if not items or not self._is_connected:
+            return
+        actual_ttl = int(ttl) if ttl is not None else self.default_ttl
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, payload in items.items():
+                data = self._compress_data(json.dumps(payload).encode('utf-8'))
+                pipe.setex(key, actual_ttl, data)
+            self._safe_cache_operation(pipe.execute)
+        except Exception as e:
+            logger.error(f"Cache compress/set error: {str(e)}")
+
+    def _tee_stream(self, chunks, cache_key, ttl):
+        """
+        Pass streamed chunks through untouched while buffering them for the
+        cache; gives up on caching once the body exceeds stream_cache_max_bytes
+        or the stream ends with an error line.
+        """
+        buffer = []
+        size = 0
+        cacheable = True
+        for chunk in chunks:
+            if chunk.startswith(STREAM_ERROR_PREFIX):
+                cacheable = False
+                buffer = []
+            if cacheable:
+                size += len(chunk)
+                if size > self.stream_cache_max_bytes:
+                    cacheable = False
+                    buffer = []
+                else:
+                    buffer.append(chunk)
+            yield chunk
+
+        if cacheable:
+            try:
+                compressed = self._compress_data(b'NDJSON:' + b''.join(buffer))
+                actual_ttl = int(ttl) if ttl is not None else self.default_ttl
+                self._safe_cache_operation(self.client.setex, cache_key, actual_ttl, compressed)
+            except Exception as e:
+                logger.error(f"Cache compress/set error: {str(e)}")
+
+    def _vary_accept(self, rv):
+        """Normalise a view's return value and mark it as varying on Accept (JSON vs NDJSON)"""
+        response = make_response(rv)
+        response.vary.add('Accept')
+        return response
+
     def cache_response(self, ttl=None):
         """Decorator to cache route responses with compression support"""
         def decorator(f):
             @wraps(f)
             def wrapper(*args, **kwargs):
                 if not self._is_connected:
-                    return f(*args, **kwargs)
+                    return self._vary_accept(f(*args, **kwargs))
                 
                 cache_key = self.make_cache_key()
                 
@@ -105,16 +188,21 @@ class RedisCache:
                 if cached:
                     try:
                         decompressed = self._decompress_data(cached);
+                        if decompressed.startswith(b'NDJSON:'):
+                            return self._vary_accept(Response(decompressed[7:], mimetype=NDJSON_MIMETYPE))
                         print(decompressed);
-                        return jsonify(json.loads(decompressed.decode('utf-8')))
+                        return self._vary_accept(jsonify(json.loads(decompressed.decode('utf-8'))))
                     except Exception as e:
                         logger.error(f"Cache decompress/deserialize error: {str(e)}")
                 
                 # Generate fresh response
-                response = f(*args, **kwargs)
+                response = self._vary_accept(f(*args, **kwargs))
                 
                 # Cache successful responses
-                if response.status_code == 200:
+                if response.status_code == 200 and response.is_streamed:
+                    # Don't buffer via get_data(); cache while the body streams out
+                    response.response = self._tee_stream(response.response, cache_key, ttl)
+                elif response.status_code == 200:
                     try:
                         data = response.get_data()
                         compressed = self._compress_data(data)
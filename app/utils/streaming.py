@@ -0,0 +1,59 @@
+import json
+import logging
+import itertools
+from flask import Response, request
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+# Trailing line written when the cursor fails mid-stream
+STREAM_ERROR_PREFIX = b'{"error": '
+
+
+def wants_ndjson():
+    """True if the client asked for NDJSON via ?format=ndjson or the Accept header"""
+    if request.args.get('format') == 'ndjson':
+        return True
+    best = request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def _encode_lines(cursor, batch_size):
+    """Encode documents one per line, flushing once per cursor batch"""
+    lines = []
+    try:
+        for document in cursor:
+            # default=str covers ObjectId/datetime values coming straight off the cursor
+            lines.append(json.dumps(document, default=str))
+            if len(lines) >= batch_size:
+                yield ('\n'.join(lines) + '\n').encode('utf-8')
+                lines = []
+    except Exception as e:
+        logger.error(f"NDJSON stream aborted: {str(e)}")
+        if lines:
+            yield ('\n'.join(lines) + '\n').encode('utf-8')
+        yield STREAM_ERROR_PREFIX + json.dumps(str(e)).encode('utf-8') + b'}\n'
+        return
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def ndjson_response(cursor, batch_size=100):
+    """
+    Stream a Mongo cursor as newline-delimited JSON without materialising it.
+
+    The first document is read here, so errors before the first byte (a
+    lazy find() cursor hitting a dead server) raise in the calling view.
+    Once the 200 has gone out the status can't change: a later failure
+    ends the body with a final {"error": "..."} line instead.
+    """
+    documents = iter(cursor)
+    try:
+        first = next(documents)
+    except StopIteration:
+        documents = iter(())
+    else:
+        documents = itertools.chain([first], documents)
+    response = Response(_encode_lines(documents, batch_size), mimetype=NDJSON_MIMETYPE)
+    response.vary.add('Accept')
+    return response
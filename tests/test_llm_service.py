@@ -0,0 +1,104 @@
+import pytest
+from app.services.llm_cache import LLMCache, SQLiteLLMCacheBackend
+from app.services.llm_service import GeminiService
+
+
+@pytest.fixture
+def llm_cache(tmp_path):
+    return LLMCache(SQLiteLLMCacheBackend(str(tmp_path / "llm_cache.sqlite3"), max_entries=2))
+
+
+@pytest.fixture
+def service(monkeypatch, llm_cache):
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    return GeminiService(cache=llm_cache)
+
+
+def test_cache_key_depends_on_model_and_payload():
+    payload = {"contents": [{"parts": [{"text": "hello"}]}], "generationConfig": {"temperature": 0.3}}
+    assert LLMCache.make_key("m", payload) == LLMCache.make_key("m", dict(payload))
+    assert LLMCache.make_key("m", payload) != LLMCache.make_key("other", payload)
+
+
+def test_cache_evicts_least_recently_used(llm_cache):
+    for i in range(3):
+        llm_cache.set("m", {"i": i}, [i])
+    assert llm_cache.get("m", {"i": 0}) is None
+    assert llm_cache.get("m", {"i": 2}) == [2]
+    assert llm_cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_summary_replayed_from_cache(service, monkeypatch):
+    calls = []
+
+    def fake_request(payload):
+        calls.append(payload)
+        return {"candidates": [{"content": {"parts": [{"text": "Short summary."}]}}]}, None
+
+    monkeypatch.setattr(service, "_make_api_request", fake_request)
+    assert service.generate_summary("Some title. Some description") == ("Short summary.", None)
+    assert service.generate_summary("Some title. Some description") == ("Short summary.", None)
+    assert len(calls) == 1
+
+
+def test_failed_summary_is_not_cached(service, monkeypatch):
+    monkeypatch.setattr(service, "_make_api_request", lambda payload: (None, "API request failed"))
+    _, error = service.generate_summary("Some title. Some description")
+    assert error
+
+    monkeypatch.setattr(
+        service,
+        "_make_api_request",
+        lambda payload: ({"candidates": [{"content": {"parts": [{"text": "Fresh."}]}}]}, None)
+    )
+    assert service.generate_summary("Some title. Some description") == ("Fresh.", None)
+    assert service.cache.stats()["hits"] == 0
+
+
+def test_stats_are_logged_periodically(llm_cache, caplog):
+    llm_cache.log_every = 2
+    with caplog.at_level("INFO", logger="app.services.llm_cache"):
+        llm_cache.get("m", {"i": 1})
+        llm_cache.get("m", {"i": 2})
+    assert "LLM cache stats" in caplog.text
+
+
+def test_safe_json_parse_extracts_array_from_prose(service):
+    text = 'Sure! Here you go:\n[{"title": "A", "tags": ["x", "]"]}, {"title": "B"}]\nEnjoy.'
+    assert service._safe_json_parse(text) == [{"title": "A", "tags": ["x", "]"]}, {"title": "B"}]
+
+
+def test_safe_json_parse_rejects_truncated_array(service):
+    with pytest.raises(ValueError):
+        service._safe_json_parse('Result: [{"title": "A"}, {"title": "B"}, {"title": "C')
+
+
+def test_safe_json_parse_skips_malformed_array(service):
+    text = 'Draft: [{"title": "A"} {"title": "B"}] Final: [{"title": "C"}]'
+    assert service._safe_json_parse(text) == [{"title": "C"}]
+
+
+def test_safe_json_parse_without_array_raises(service):
+    with pytest.raises(ValueError):
+        service._safe_json_parse("no json here")
+
+
+def test_corrupt_entry_is_a_miss_and_dropped(llm_cache):
+    key = LLMCache.make_key("m", {"i": 1})
+    llm_cache.backend.set(key, '{"truncated', 60)
+    assert llm_cache.get("m", {"i": 1}) is None
+    assert llm_cache.backend.get(key) is None
+    assert llm_cache.stats()["misses"] == 1
+
+
+def test_article_generation_is_not_cached(service, monkeypatch):
+    calls = []
+
+    def fake_request(payload):
+        calls.append(payload)
+        return {"candidates": [{"content": {"parts": [{"text": '[{"title": "A"}]'}]}}]}, None
+
+    monkeypatch.setattr(service, "_make_api_request", fake_request)
+    service.generate_news_articles("Technology", 1)
+    service.generate_news_articles("Technology", 1)
+    assert len(calls) == 2
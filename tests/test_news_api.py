@@ -1,6 +1,8 @@
+import json
 import pytest
 from app import create_app
 from app.db.mongodb import get_db
+from app.db.repositories import news_repository
 
 @pytest.fixture
 def client():
@@ -12,4 +14,101 @@ def client():
 def test_category_endpoint(client):
     response = client.get('/api/v1/news/category?name=Technology')
     assert response.status_code == 200
-    assert 'articles' in response.json
\ No newline at end of file
+    assert 'articles' in response.json
+
+def test_batch_endpoint(client):
+    response = client.post('/api/v1/news/batch', json={
+        "queries": [
+            {"type": "category", "category": "Technology", "limit": 2},
+            {"type": "score", "min_score": 0.5},
+            {"type": "nearby", "lat": 37.77, "lon": -122.42},
+            {"type": "unknown"}
+        ]
+    })
+    assert response.status_code == 200
+    results = response.json['results']
+    assert len(results) == 4
+    assert 'articles' in results[0]
+    assert results[2]['meta']['type'] == 'nearby'
+    assert 'error' in results[3]
+
+
+def test_batch_endpoint_requires_queries(client):
+    response = client.post('/api/v1/news/batch', json={})
+    assert response.status_code == 400
+
+
+def test_category_endpoint_ndjson(client):
+    response = client.get('/api/v1/news/category?category=Technology&limit=3&format=ndjson')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert 'Accept' in response.headers.get('Vary', '')
+    lines = response.get_data(as_text=True).splitlines()
+    assert 1 <= len(lines) <= 3
+    assert all(json.loads(line)['category'] == 'Technology' for line in lines)
+
+
+def test_score_endpoint_ndjson_via_accept_header(client):
+    response = client.get(
+        '/api/v1/news/score?min_score=0.5',
+        headers={'Accept': 'application/x-ndjson'}
+    )
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+
+
+def test_batch_endpoint_rejects_bad_limit_per_query(client):
+    response = client.post('/api/v1/news/batch', json={
+        "queries": [
+            {"type": "category", "category": "Technology", "limit": 0},
+            {"type": "score", "limit": 100000},
+            {"type": "source", "source": "FallbackSource", "limit": 2}
+        ]
+    })
+    assert response.status_code == 200
+    results = response.json['results']
+    assert 'error' in results[0]
+    assert 'error' in results[1]
+    assert 'articles' in results[2]
+
+
+def test_nearby_endpoint_ndjson(client):
+    response = client.get('/api/v1/news/nearby?lat=37.77&lon=-122.42&limit=2&format=ndjson')
+    assert response.status_code == 200
+    lines = response.get_data(as_text=True).splitlines()
+    assert 1 <= len(lines) <= 2
+    assert all('error' not in json.loads(line) for line in lines)
+
+
+def test_batch_endpoint_rejects_non_object_body(client):
+    response = client.post('/api/v1/news/batch', json=[1, 2])
+    assert response.status_code == 400
+
+
+def test_ndjson_stream_failure_ends_with_error_line_and_is_not_cached(client, monkeypatch):
+    calls = []
+
+    def failing_cursor(query, batch_size=100):
+        calls.append(query)
+        yield {"title": "First"}
+        raise RuntimeError("cursor died")
+
+    monkeypatch.setattr(news_repository, 'stream_articles', failing_cursor)
+    url = '/api/v1/news/category?category=StreamFailureTest&format=ndjson'
+    for _ in range(2):
+        response = client.get(url)
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert lines[0] == {"title": "First"}
+        assert lines[-1] == {"error": "cursor died"}
+    assert len(calls) == 2
+
+
+def test_ndjson_failure_before_first_byte_returns_500(client, monkeypatch):
+    def dead_cursor(query, batch_size=100):
+        raise RuntimeError("server unavailable")
+        yield
+
+    monkeypatch.setattr(news_repository, 'stream_articles', dead_cursor)
+    response = client.get('/api/v1/news/score?min_score=0.99&format=ndjson')
+    assert response.status_code == 500